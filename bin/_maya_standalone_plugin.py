@@ -0,0 +1,42 @@
+"""
+pytest plugin that brings up Maya standalone inside each xdist worker.
+
+The workers import and run MayaTestCase tests directly, bypassing
+mayaunittest.run_tests_from_commandline and the initialize() call it makes,
+so without this every cmds.* call in a worker would fail. Loaded by name
+(-p _maya_standalone_plugin) from run_maya_tests.run_tests_in_mayapy, which
+makes sure this directory is on PYTHONPATH for the worker processes.
+
+Only workers initialize: the controller just coordinates and collecting
+there does not execute any Maya commands.
+"""
+import os
+
+
+def pytest_sessionstart(session):
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker:
+        # Each worker gets its own prefs so they do not contend for one
+        # pref-file set. Nesting under the controller's MAYA_APP_DIR means
+        # the controller's cleanup removes the worker dirs too; without a
+        # clean app dir configured there is nowhere safe to put one, so the
+        # inherited prefs are kept.
+        base = os.environ.get("MAYA_APP_DIR")
+        if base:
+            app_dir = os.path.join(base, worker)
+            os.makedirs(app_dir, exist_ok=True)
+            os.environ["MAYA_APP_DIR"] = app_dir
+
+        import maya.standalone
+        maya.standalone.initialize()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        import maya.standalone
+        try:
+            maya.standalone.uninitialize()
+        except Exception:
+            # Some Maya versions throw on teardown; the worker is exiting
+            # anyway.
+            pass
@@ -0,0 +1,86 @@
+"""
+Front end for run_maya_tests.py --daemon.
+
+Starts one mayapy test daemon and dispatches test runs to it over stdin, so
+Maya standalone initialization (5-15s) is paid once per session instead of
+once per rerun. All arguments are forwarded to run_maya_tests.py unchanged.
+
+Example:
+    py run_maya_tests_client.py --maya 2024 --packages D:\projects\pkgA
+    dirs (blank = packages, q = quit)>
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+
+class MayaTestDaemonClient(object):
+    """Owns the daemon process and speaks its JSON-line protocol."""
+
+    def __init__(self, runner_args):
+        self._runner_args = list(runner_args)
+        self._proc = None
+
+    def start(self):
+        script = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              "run_maya_tests.py")
+        cmd = [sys.executable, script] + self._runner_args + ["--daemon"]
+        self._proc = subprocess.Popen(cmd, stdin=subprocess.PIPE,
+                                      stdout=subprocess.PIPE,
+                                      universal_newlines=True)
+
+    def run(self, dirs=None):
+        """Run the given test directories (None reruns the --packages dirs)."""
+        self._proc.stdin.write(json.dumps({"dirs": dirs}) + "\n")
+        self._proc.stdin.flush()
+
+        # The daemon's stdout carries status prints too; the reply is the
+        # next JSON line with an "rc" key.
+        for line in self._proc.stdout:
+            line = line.strip()
+            if not line.startswith("{"):
+                if line:
+                    print(line)
+                continue
+            try:
+                reply = json.loads(line)
+            except ValueError:
+                continue
+            if "rc" in reply:
+                return int(reply["rc"])
+        raise RuntimeError("Test daemon exited before replying.")
+
+    def stop(self):
+        if self._proc is None or self._proc.poll() is not None:
+            return
+        try:
+            self._proc.stdin.write(json.dumps({"quit": True}) + "\n")
+            self._proc.stdin.flush()
+        except OSError:
+            pass
+        self._proc.wait()
+
+
+def main():
+    client = MayaTestDaemonClient(sys.argv[1:])
+    client.start()
+
+    rc = 0
+    try:
+        while True:
+            line = input("dirs (blank = packages, q = quit)> ").strip()
+            if line.lower() in ("q", "quit"):
+                break
+            rc = client.run(line.split() or None)
+            print("rc: {0}".format(rc))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        client.stop()
+    return rc
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
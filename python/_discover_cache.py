@@ -0,0 +1,92 @@
+"""
+On-disk cache for unittest discovery results.
+
+Discovery is a repeatable computation: for an unchanged test directory it
+always yields the same test ids, so the directory walk and per-module import
+that discover() performs can be skipped on reruns. Entries are keyed on the
+mtimes of every .py file under the directory, so any edit invalidates the
+cache by itself - there is no explicit invalidation.
+
+The shelve file lives in the system temp directory and every operation is
+best effort: a broken or unwritable cache simply falls back to a normal
+discovery pass.
+"""
+import os
+import shelve
+import tempfile
+import threading
+import unittest
+
+_DB_PATH = os.path.join(tempfile.gettempdir(), "mayaunittest_discover")
+
+# shelve (and the dbm backends underneath) is not safe for concurrent
+# open/read/write, so serialize access when discovery runs in worker threads.
+_db_lock = threading.Lock()
+
+
+def signature(directory):
+    """Return a hashable signature of all .py file mtimes under directory."""
+    sig = []
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = sorted(os.scandir(current), key=lambda entry: entry.path)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir():
+                stack.append(entry.path)
+            elif entry.name.endswith(".py"):
+                try:
+                    sig.append((entry.path, entry.stat().st_mtime_ns))
+                except OSError:
+                    pass
+    return tuple(sig)
+
+
+def _has_failed_tests(test_ids):
+    """
+    True when discovery produced _FailedTest placeholders.
+
+    Those record a failed import, which can be caused by the environment
+    (missing dependency, wrong sys.path) without any .py mtime changing -
+    caching them would replay the failure into every later process even
+    after the environment is fixed.
+    """
+    return any("_FailedTest" in test_id for test_id in test_ids)
+
+
+def get(directory, sig):
+    """Return the cached test ids for directory, or None on miss/mismatch."""
+    try:
+        with _db_lock, shelve.open(_DB_PATH) as db:
+            cached = db.get(directory)
+    except Exception:
+        return None
+    if cached and cached.get("signature") == sig \
+            and not _has_failed_tests(cached["test_ids"]):
+        return cached["test_ids"]
+    return None
+
+
+def put(directory, sig, test_ids):
+    """Store the discovered test ids for directory under its signature."""
+    if _has_failed_tests(test_ids):
+        return
+    try:
+        with _db_lock, shelve.open(_DB_PATH) as db:
+            db[directory] = {"signature": sig, "test_ids": list(test_ids)}
+    except Exception:
+        pass
+
+
+def test_ids(suite):
+    """Flatten a (possibly nested) TestSuite into a list of dotted test ids."""
+    ids = []
+    for item in suite:
+        if isinstance(item, unittest.TestSuite):
+            ids.extend(test_ids(item))
+        else:
+            ids.append(item.id())
+    return ids
@@ -8,20 +8,31 @@ Requirements:
     - Test case classes must be named with a "Tests" suffix.
     - MAYA_LOCATION environment variable must be set to the Maya installation path.
 """
+import collections
+import concurrent.futures
+import functools
 import logging
 import os
+import re
 import shutil
+import subprocess
 import sys
 import tempfile
+import threading
 import unittest
 import uuid
 
+import _discover_cache
 
+
+@functools.lru_cache(None)
 def mayapython():
     """
     Return Maya's site-packages path; raise informative error if not configured.
 
     We probe a few known layouts because they differ by OS and Maya version.
+    Cached so the isdir() probing runs once per interpreter session, however
+    often the module machinery evaluates it.
     """
     maya_loc = os.environ.get("MAYA_LOCATION")
     if not maya_loc:
@@ -47,22 +58,26 @@ def mayapython():
 
 
 def filter_sys_path(literals):
-    syspaths = list(sys.path)
-    for fp in syspaths:
-        if all([l in fp for l in literals]):
-            try:
-                sys.path.remove(fp)
-            except ValueError:
-                pass
+    """
+    Drop every sys.path entry that contains all the given literals.
+
+    One compiled lookahead per literal and a single slice assignment: the
+    matching runs in C and sys.path is rebuilt in place in one pass, instead
+    of k substring scans per entry plus an O(n) remove() per hit.
+    """
+    pattern = re.compile("".join("(?=.*{0})".format(re.escape(l)) for l in literals))
+    sys.path[:] = [fp for fp in sys.path if not pattern.match(fp)]
 
 
 # Remove auto-completion path that overrides real maya python libs.
 filter_sys_path(["pymel", "extras", "completion"])
 
-# Make sure Maya's site-packages comes first before anything else.
+# Make sure Maya's site-packages comes first before anything else. The cheap
+# head check skips the linear sys.path scan on hot re-imports.
 maya_site = mayapython()
-if maya_site not in sys.path:
-    sys.path.insert(0, maya_site)
+if not sys.path or sys.path[0] != maya_site:
+    if maya_site not in sys.path:
+        sys.path.insert(0, maya_site)
 
 # Once auto-completion path removed we can import maya modules.
 import maya.cmds as cmds  # noqa: E402
@@ -71,6 +86,27 @@ import maya.standalone  # noqa: E402
 
 CUSTOM_RUNNER = "DL_UNITTEST"
 
+# Mirrors the CUSTOM_RUNNER env var for in-process checks: tearDown runs
+# after every test, and a plain boolean is cheaper there than an os.environ
+# lookup (which is case-insensitive on Windows). The env var itself stays so
+# child processes can still see it.
+_CUSTOM_RUNNER_ACTIVE = False
+
+
+@functools.lru_cache(None)
+def _maya_version():
+    """
+    Maya version as a float, resolved once per process.
+
+    Lazy rather than module-level because cmds.about cannot run before
+    maya.standalone is initialized; the C++ boundary crossing and the float
+    parse still happen only on the first call.
+    """
+    try:
+        return float(cmds.about(v=True))
+    except Exception:
+        return 0.0
+
 
 def run_tests(directories=None, test=None, test_suite=None):
     if test_suite is None:
@@ -79,7 +115,70 @@ def run_tests(directories=None, test=None, test_suite=None):
     runner = unittest.TextTestRunner(verbosity=2, resultclass=MayaTestResult)
     runner.failfast = False
     runner.buffer = Settings.buffer_output
-    runner.run(test_suite)
+    return runner.run(test_suite)
+
+
+def _discover(loader, p):
+    """
+    Run loader.discover pinned to this repo's test layout.
+
+    The explicit test_*.py pattern matches the naming convention, and
+    passing top_level_dir skips discover()'s walk up the parent chain
+    stating for __init__.py ancestors - a dozen syscalls per call for
+    deeply nested Maya module layouts.
+    """
+    return loader.discover(start_dir=p, pattern="test_*.py", top_level_dir=p)
+
+
+def _discover_directory(p):
+    """
+    Discover the tests under a single directory.
+
+    Returns (suite, added_path) where suite is None when the directory has
+    no test modules and added_path is the path pushed onto sys.path (or
+    None). Runs in a worker thread, so it gets its own TestLoader -
+    discover() stores walk state on the loader and sharing one across
+    threads would race. Imported test modules still land in the shared
+    sys.modules either way.
+    """
+    # discover() abspaths top_level_dir before touching sys.path; use the
+    # same form everywhere so the pre-add below shadows its insert.
+    p = os.path.abspath(p)
+    loader = unittest.TestLoader()
+
+    # The signature pass below already walks the whole tree, so reuse it to
+    # skip directories with no test modules anywhere beneath them (discover()
+    # runs a recursive import pass even for empty dirs). Recursing matters:
+    # a tests dir whose modules live only in a subpackage must not be
+    # skipped. An unreadable directory yields an empty signature and is
+    # skipped the same way.
+    sig = _discover_cache.signature(p)
+    if not any(os.path.basename(path).startswith("test_") for path, _ in sig):
+        return None, None
+
+    # Pre-add the directory ourselves: discover() inserts top_level_dir
+    # into sys.path when it is absent and never removes it, which would
+    # leave the _sys_path_set mirror stale and the entry leaked. Going
+    # through add_to_path keeps the mirror in sync and lets get_tests
+    # remove the entry afterwards.
+    added_path = None
+    with _path_lock:
+        if add_to_path(p):
+            added_path = p
+
+    # Reuse the previous discovery result while no .py file under the
+    # directory changed; the signature walk is one scandir pass versus the
+    # module imports a full discover() performs.
+    cached_ids = _discover_cache.get(p, sig)
+    if cached_ids is not None:
+        try:
+            return loader.loadTestsFromNames(cached_ids), added_path
+        except Exception:
+            return _discover(loader, p), added_path
+
+    discovered_suite = _discover(loader, p)
+    _discover_cache.put(p, sig, _discover_cache.test_ids(discovered_suite))
+    return discovered_suite, added_path
 
 
 def get_tests(directories=None, test=None, test_suite=None):
@@ -102,19 +201,33 @@ def get_tests(directories=None, test=None, test_suite=None):
     directories_added_to_path = []
 
     if test:
+        loader = unittest.TestLoader()
         # Add test directories to sys.path so loadTestsFromName can import modules
         for p in directories:
-            if add_to_path(p):
-                directories_added_to_path.append(p)
+            with _path_lock:
+                if add_to_path(p):
+                    directories_added_to_path.append(p)
 
-        discovered_suite = unittest.TestLoader().loadTestsFromName(test)
+        discovered_suite = loader.loadTestsFromName(test)
         if discovered_suite.countTestCases():
             test_suite.addTests(discovered_suite)
     else:
-        for p in directories:
-            discovered_suite = unittest.TestLoader().discover(p)
-            if discovered_suite.countTestCases():
-                test_suite.addTests(discovered_suite)
+        directories = list(directories)
+        if directories:
+            # Each directory is discovered independently, so overlap the
+            # walks and imports across threads: cold-cache wall time
+            # approaches the slowest directory instead of the sum of all
+            # of them. Results are collected in submission order so the
+            # suite stays deterministic.
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(8, len(directories))) as executor:
+                futures = [executor.submit(_discover_directory, p) for p in directories]
+                for future in futures:
+                    discovered_suite, added_path = future.result()
+                    if added_path:
+                        directories_added_to_path.append(added_path)
+                    if discovered_suite is not None and discovered_suite.countTestCases():
+                        test_suite.addTests(discovered_suite)
 
     # Remove the added paths.
     for path in directories_added_to_path:
@@ -122,36 +235,68 @@ def get_tests(directories=None, test=None, test_suite=None):
             sys.path.remove(path)
         except ValueError:
             pass
+        _sys_path_set.discard(path)
 
     return test_suite
 
 
-def maya_module_tests():
-    """Generator function to iterate over all the Maya module tests directories."""
-    module_path = os.environ.get("MAYA_MODULE_PATH", "")
+@functools.lru_cache(maxsize=1)
+def _module_test_dirs(module_path):
+    """
+    Resolve the tests directories for a MAYA_MODULE_PATH value.
+
+    Keyed on the raw env string so the cache invalidates whenever the env
+    var changes. Each module dir is read once with os.scandir rather than
+    stat'ing a constructed tests path.
+    """
+    test_dirs = []
     for path in module_path.split(os.pathsep):
-        p = "{0}/tests".format(path)
-        if os.path.exists(p):
-            yield p
+        if not path:
+            continue
+        try:
+            entries = {entry.name: entry for entry in os.scandir(path)}
+        except OSError:
+            continue
+        tests = entries.get("tests")
+        if tests is not None and tests.is_dir():
+            test_dirs.append(os.path.join(path, "tests"))
+    # A tuple: lru_cache hands every caller the same object, so a mutable
+    # list would let one caller corrupt the cache for the whole process.
+    return tuple(test_dirs)
+
+
+def maya_module_tests():
+    """Return all the Maya module tests directories."""
+    return _module_test_dirs(os.environ.get("MAYA_MODULE_PATH", ""))
 
 
 def run_tests_from_commandline(directories=None, test=None, test_suite=None):
-    """Runs the tests in Maya standalone mode."""
+    """
+    Runs the tests in Maya standalone mode.
+
+    Returns 0 when every test passed, 1 otherwise, so command-line callers
+    can propagate the status as their exit code.
+    """
     maya.standalone.initialize()
 
-    # Ensure PYTHONPATH entries are present in sys.path
-    realsyspath = [os.path.realpath(p) for p in sys.path]
+    # Ensure PYTHONPATH entries are present in sys.path. A set gives O(1)
+    # membership checks, and each entry is realpath'ed exactly once.
+    realsyspath = {os.path.realpath(p) for p in sys.path}
     pythonpath = os.environ.get("PYTHONPATH", "")
     for p in pythonpath.split(os.pathsep):
         p = os.path.realpath(p)
         if p and p not in realsyspath:
             sys.path.insert(0, p)
+            realsyspath.add(p)
+            # Keep the mirror honest, or a later add_to_path of the same
+            # entry inserts a duplicate.
+            _sys_path_set.add(p)
 
-    run_tests(directories, test, test_suite)
+    result = run_tests(directories, test, test_suite)
 
     # Starting Maya 2016, we have to call uninitialize
     try:
-        if float(cmds.about(v=True)) >= 2016.0:
+        if _maya_version() >= 2016.0:
             maya.standalone.uninitialize()
     except Exception:
         # Be defensive: still try to uninitialize if possible
@@ -160,14 +305,53 @@ def run_tests_from_commandline(directories=None, test=None, test_suite=None):
         except Exception:
             pass
 
-
-class Settings:
-    temp_dir = os.path.join(tempfile.gettempdir(), "mayaunittest", str(uuid.uuid4()))
+    return 0 if result.wasSuccessful() else 1
+
+
+class _SettingsMeta(type):
+    """Metaclass that materializes Settings.temp_dir lazily."""
+
+    @property
+    def temp_dir(cls):
+        if cls._temp_dir is None:
+            if cls.delete_files:
+                # Managed by TemporaryDirectory: its finalizer removes the
+                # tree at interpreter exit even when a run crashes half-way,
+                # and importing the module no longer claims a temp namespace
+                # whether or not any test ever writes a file.
+                cls._temp_dir_obj = tempfile.TemporaryDirectory(prefix="mayaunittest_")
+                cls._temp_dir = cls._temp_dir_obj.name
+            else:
+                # Files are being kept; plain mkdtemp has no finalizer.
+                cls._temp_dir = tempfile.mkdtemp(prefix="mayaunittest_")
+        return cls._temp_dir
+
+    @temp_dir.setter
+    def temp_dir(cls, directory):
+        cls._temp_dir = directory
+        # Dropping the managed object cleans its old dir via the finalizer.
+        cls._temp_dir_obj = None
+
+
+class Settings(metaclass=_SettingsMeta):
+    _temp_dir = None
+    _temp_dir_obj = None
     delete_files = True
     buffer_output = True
     file_new = True
 
 
+def _release_temp_dir():
+    """Detach the managed temp dir finalizer so its files survive exit."""
+    obj = Settings._temp_dir_obj
+    if obj is not None:
+        try:
+            obj._finalizer.detach()
+        except (AttributeError, ValueError):
+            pass
+        Settings._temp_dir_obj = None
+
+
 def set_temp_dir(directory):
     if os.path.exists(directory):
         Settings.temp_dir = directory
@@ -177,6 +361,8 @@ def set_temp_dir(directory):
 
 def set_delete_files(value):
     Settings.delete_files = value
+    if not value:
+        _release_temp_dir()
 
 
 def set_buffer_output(value):
@@ -187,15 +373,48 @@ def set_file_new(value):
     Settings.file_new = value
 
 
+# Mirrors sys.path for O(1) membership checks; kept in sync by this
+# module's own sys.path mutations (add_to_path / get_tests).
+_sys_path_set = set(sys.path)
+
+# Serializes add_to_path when discovery workers run concurrently.
+_path_lock = threading.Lock()
+
+
 def add_to_path(path):
-    if os.path.exists(path) and path not in sys.path:
+    if path not in _sys_path_set and os.path.exists(path):
         sys.path.insert(0, path)
+        _sys_path_set.add(path)
         return True
     return False
 
 
+def _async_cleanup(path):
+    """
+    Rename the directory aside and delete it off the critical path.
+
+    The rename is a single atomic syscall, and the detached native remover
+    does the real work after the test run has already returned - so wrapping
+    up a run costs the same whether the temp tree holds ten files or 100k.
+    """
+    renamed = "{0}.pending_{1}".format(path, uuid.uuid4().hex)
+    try:
+        os.rename(path, renamed)
+    except OSError:
+        renamed = path
+
+    cmd = (["cmd", "/c", "rd", "/s", "/q", renamed] if sys.platform == "win32"
+           else ["rm", "-rf", renamed])
+    try:
+        subprocess.Popen(cmd, close_fds=True)
+    except OSError:
+        shutil.rmtree(renamed, ignore_errors=True)
+
+
 class MayaTestCase(unittest.TestCase):
-    files_created = []
+    # deque: O(1) popleft drain in delete_temp_files and O(1) clear, with no
+    # large-list reallocation over long suites.
+    files_created = collections.deque()
     plugins_loaded = set()
 
     @classmethod
@@ -206,7 +425,6 @@ class MayaTestCase(unittest.TestCase):
     @classmethod
     def unload_plugins(cls):
         if not cls.plugins_loaded:
-            cls.plugins_loaded = set()
             return
 
         for plugin in list(cls.plugins_loaded):
@@ -215,28 +433,33 @@ class MayaTestCase(unittest.TestCase):
             except Exception as e:
                 logging.warning("Failed to unload plugin %s: %s", plugin, e)
 
-        cls.plugins_loaded = set()
+        # clear() reuses the existing hash table instead of allocating a new
+        # set every teardown.
+        cls.plugins_loaded.clear()
 
     @classmethod
     def delete_temp_files(cls):
         if not Settings.delete_files:
             return
 
-        for f in list(cls.files_created):
+        # Files inside the temp dir are owned by its TemporaryDirectory and
+        # swept wholesale at the end of the run; removing them one by one
+        # here would just redo that work. Only paths outside the temp dir
+        # need individual deletes, and opening with EAFP trades the exists()
+        # stat for a single syscall. Read _temp_dir directly so an empty
+        # drain does not materialize a dir nothing ever wrote to.
+        temp_dir = Settings._temp_dir or ""
+        while cls.files_created:
+            f = cls.files_created.popleft()
+            if temp_dir and f.startswith(temp_dir):
+                continue
             try:
-                if os.path.exists(f):
-                    os.remove(f)
+                os.remove(f)
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 logging.warning("Failed to remove temp file %s: %s", f, e)
 
-        cls.files_created = []
-
-        try:
-            if os.path.exists(Settings.temp_dir):
-                shutil.rmtree(Settings.temp_dir)
-        except Exception as e:
-            logging.warning("Failed to remove temp dir %s: %s", Settings.temp_dir, e)
-
     @classmethod
     def tearDownClass(cls):
         super(MayaTestCase, cls).tearDownClass()
@@ -245,31 +468,73 @@ class MayaTestCase(unittest.TestCase):
 
     @classmethod
     def get_temp_filename(cls, file_name):
-        temp_dir = Settings.temp_dir
-        os.makedirs(temp_dir, exist_ok=True)
-
-        candidate = os.path.join(temp_dir, file_name)
+        """
+        Reserve a unique path under the temp dir and return it.
+
+        The returned path exists as an empty placeholder file - that is
+        what makes the reservation race-free; there is no atomic way to
+        claim a name and leave it unlinked. Callers must therefore
+        overwrite it, and Maya exports that refuse pre-existing files need
+        force=True (e.g. cmds.file(es=path, type=..., force=True)).
+
+        Name collisions get a numeric suffix: scene.ma, scene1.ma, ...
+        """
+        candidate = os.path.join(Settings.temp_dir, file_name)
+        # candidate always lives under temp_dir, so this single makedirs
+        # covers the temp root as well.
         parent_dir = os.path.dirname(candidate)
-        if parent_dir:
-            os.makedirs(parent_dir, exist_ok=True)
+        os.makedirs(parent_dir, exist_ok=True)
 
         base, ext = os.path.splitext(candidate)
-        path = candidate
+
+        # O_CREAT|O_EXCL both tests for and reserves the name in one atomic
+        # syscall: no stat-then-open race window between concurrent runs
+        # sharing a temp dir, and one syscall per probe instead of two.
         count = 0
-        while os.path.exists(path):
-            count += 1
-            path = "{0}{1}{2}".format(base, count, ext)
+        path = candidate
+        while True:
+            try:
+                fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+            except FileExistsError:
+                count += 1
+                path = "{0}{1}{2}".format(base, count, ext)
+            else:
+                os.close(fd)
+                break
 
         cls.files_created.append(path)
         return path
 
     def assertListAlmostEqual(self, first, second, places=7, msg=None, delta=None):
-        self.assertEqual(len(first), len(second), msg)
-        for a, b in zip(first, second):
-            self.assertAlmostEqual(a, b, places, msg, delta)
+        """
+        Assert two sequences of numbers are element-wise almost equal.
+
+        Vectorized through NumPy (always shipped with mayapy): comparing
+        10k+ vertex positions becomes one C-level scan instead of a Python
+        assertAlmostEqual frame per element. Falls back to the per-element
+        loop when NumPy is unavailable.
+        """
+        try:
+            import numpy
+        except ImportError:
+            self.assertEqual(len(first), len(second), msg)
+            for a, b in zip(first, second):
+                self.assertAlmostEqual(a, b, places, msg, delta)
+            return
+
+        a = numpy.asarray(first, dtype=numpy.float64)
+        b = numpy.asarray(second, dtype=numpy.float64)
+        self.assertEqual(a.shape, b.shape, msg)
+        # Same tolerance assertAlmostEqual uses: |a-b| rounded to `places`
+        # is zero, or |a-b| <= delta when delta is given. equal_nan=False
+        # likewise matches it - assertAlmostEqual(nan, nan) fails, and
+        # NaN-filled geometry must not compare green.
+        tol = delta if delta is not None else 0.5 * 10 ** (-places)
+        numpy.testing.assert_allclose(a, b, rtol=0.0, atol=tol,
+                                      equal_nan=False, err_msg=msg or "")
 
     def tearDown(self):
-        if Settings.file_new and CUSTOM_RUNNER not in os.environ:
+        if Settings.file_new and not _CUSTOM_RUNNER_ACTIVE:
             cmds.file(f=True, new=True)
 
 
@@ -277,27 +542,52 @@ class MayaTestResult(unittest.TextTestResult):
     def __init__(self, stream, descriptions, verbosity):
         super(MayaTestResult, self).__init__(stream, descriptions, verbosity)
         self.successes = []
+        self._saved_handlers = None
+        self._saved_level = None
 
     def startTestRun(self):
+        global _CUSTOM_RUNNER_ACTIVE
         super(MayaTestResult, self).startTestRun()
         os.environ[CUSTOM_RUNNER] = "1"
+        _CUSTOM_RUNNER_ACTIVE = True
 
         ScriptEditorState.suppress_output()
         if Settings.buffer_output:
-            logging.disable(logging.CRITICAL)
+            # Swap the root handlers for a NullHandler rather than
+            # logging.disable: log calls short-circuit at the handler layer
+            # and the process-wide disable check is left alone for all the
+            # loggers Maya itself owns.
+            self._saved_handlers = logging.root.handlers[:]
+            self._saved_level = logging.root.level
+            logging.root.handlers = [logging.NullHandler()]
+            logging.root.setLevel(logging.CRITICAL + 1)
 
     def stopTestRun(self):
-        if Settings.buffer_output:
-            logging.disable(logging.NOTSET)
+        global _CUSTOM_RUNNER_ACTIVE
+        if self._saved_handlers is not None:
+            logging.root.handlers = self._saved_handlers
+            logging.root.setLevel(self._saved_level)
+            self._saved_handlers = None
+            self._saved_level = None
 
         ScriptEditorState.restore_output()
 
-        if Settings.delete_files and os.path.exists(Settings.temp_dir):
+        # Read _temp_dir directly: going through the property would lazily
+        # create a dir just to delete it again.
+        temp_dir = Settings._temp_dir
+        if Settings.delete_files and temp_dir is not None and os.path.exists(temp_dir):
             try:
-                shutil.rmtree(Settings.temp_dir)
+                _async_cleanup(temp_dir)
             except Exception as e:
-                logging.warning("Failed to remove temp dir %s: %s", Settings.temp_dir, e)
-
+                logging.warning("Failed to remove temp dir %s: %s", temp_dir, e)
+            if Settings._temp_dir_obj is not None:
+                # The tree is gone (or renamed aside); detach the finalizer
+                # so it does not chase the missing path at exit, and reset so
+                # a later run in this session gets a fresh managed dir.
+                _release_temp_dir()
+                Settings._temp_dir = None
+
+        _CUSTOM_RUNNER_ACTIVE = False
         if CUSTOM_RUNNER in os.environ:
             del os.environ[CUSTOM_RUNNER]
 
@@ -322,10 +612,27 @@ class ScriptEditorState(object):
     @classmethod
     def suppress_output(cls):
         if Settings.buffer_output:
-            cls.suppress_results = cmds.scriptEditorInfo(q=True, suppressResults=True)
-            cls.suppress_errors = cmds.scriptEditorInfo(q=True, suppressErrors=True)
-            cls.suppress_warnings = cmds.scriptEditorInfo(q=True, suppressWarnings=True)
-            cls.suppress_info = cmds.scriptEditorInfo(q=True, suppressInfo=True)
+            if cls.suppress_results is None:
+                # Read the user's flags once per process: each
+                # scriptEditorInfo call crosses the Python->MEL->C++
+                # boundary, and only this runner touches the flags after the
+                # first run. Try one fused query first; if Maya only answers
+                # a single flag, fall back to the four separate calls.
+                flags = cmds.scriptEditorInfo(
+                    q=True,
+                    suppressResults=True,
+                    suppressErrors=True,
+                    suppressWarnings=True,
+                    suppressInfo=True,
+                )
+                if isinstance(flags, (list, tuple)) and len(flags) == 4:
+                    (cls.suppress_results, cls.suppress_errors,
+                     cls.suppress_warnings, cls.suppress_info) = flags
+                else:
+                    cls.suppress_results = cmds.scriptEditorInfo(q=True, suppressResults=True)
+                    cls.suppress_errors = cmds.scriptEditorInfo(q=True, suppressErrors=True)
+                    cls.suppress_warnings = cmds.scriptEditorInfo(q=True, suppressWarnings=True)
+                    cls.suppress_info = cmds.scriptEditorInfo(q=True, suppressInfo=True)
             cmds.scriptEditorInfo(
                 e=True,
                 suppressResults=True,